@@ -0,0 +1,53 @@
+"""
+Numba kernels for the fast dice rolls.
+
+The kernels step the same LCG as `checks._lcg`, taking the generator state as argument and returning the advanced state alongside the result.
+They consume exactly one LCG step per die, like the pure-Python fast path, so both produce the same rolls for the same seed.
+
+Importing this module requires Numba and compiles the kernels, hence `checks` only imports it on the first roll that uses them.
+"""
+
+import numpy as np
+
+from numba import njit
+
+_MUL = np.uint64(6364136223846793005)
+_INC = np.uint64(1442695040888963407)
+_SHIFT = np.uint64(33)
+_D20 = np.uint64(20)
+_D6 = np.uint64(6)
+
+
+@njit('Tuple((int64, uint64))(int64, uint64)', cache=True)
+def d20Kernel(adv, state):
+    result = 21 if adv < 0 else 0
+    for _ in range(abs(adv) + 1):
+        state = state * _MUL + _INC
+        face = np.int64((state >> _SHIFT) % _D20) + 1
+        if adv < 0:
+            result = min(result, face)
+        else:
+            result = max(result, face)
+    return result, state
+
+
+@njit('Tuple((int64, uint64))(int64, uint64)', cache=True)
+def d6Kernel(count, state):
+    result = 0
+    for _ in range(count):
+        state = state * _MUL + _INC
+        result += np.int64((state >> _SHIFT) % _D6) + 1
+    return result, state
+
+
+@njit('Tuple((boolean, int64, uint64))(int64, int64, uint64)', cache=True)
+def extendedCheckKernel(threshold, maxRolls, state):
+    accumulator = 0
+    rollCount = 0
+    while accumulator < threshold:
+        if maxRolls != 0 and rollCount >= maxRolls:
+            return False, maxRolls, state
+        state = state * _MUL + _INC
+        accumulator += np.int64((state >> _SHIFT) % _D20) + 1
+        rollCount += 1
+    return True, rollCount, state
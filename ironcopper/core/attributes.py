@@ -5,9 +5,16 @@ Attributes model character's inherent characteristics.
 They determine stats like a characters physical strength or how attractive they are.
 """
 
+import random
+
 from typing import Optional, Tuple
 from .checks import Outcome, check, extendedCheck
 
+__all__ = [
+    'Attribute', 'Strength', 'Dexterity', 'Constitution', 'Intelligence', 'Wisdom', 'Charisma',
+    'verboseAttributeChecks',
+]
+
 
 class Attribute:
     """
@@ -17,10 +24,21 @@ class Attribute:
     - `.score`
     """
 
+    __slots__ = ('_score', 'label', '_mod')
+
     def __init__(self, score, label):
         self.score = score
         self.label = label
 
+    @property
+    def score(self):
+        return self._score
+
+    @score.setter
+    def score(self, score):
+        self._score = score
+        self._mod = score - 10
+
     def modifier(self):
         """
         Checks are commonly done in combination with a given attribute or skill.
@@ -28,19 +46,21 @@ class Attribute:
 
         `new_threshold = old_threshold - (score - 10)`
         """
-        return self.score - 10
+        return self._mod
 
-    def check(self, threshold: int, adv: int = 0) -> Outcome:
+    def check(self, threshold: int, adv: int = 0, rng: Optional[random.Random] = None) -> Outcome:
+        mod = self._mod
         if verboseAttributeChecks:
-            print(f'{self.label} modifier: {self.modifier()}')
+            print(f'{self.label} modifier: {mod}')
 
-        return check(threshold - self.modifier(), adv)
+        return check(threshold - mod, adv, rng)
 
-    def extendedCheck(self, threshold: int, maxRolls: Optional[int] = None) -> Tuple[Outcome, int]:
+    def extendedCheck(self, threshold: int, maxRolls: Optional[int] = None, rng: Optional[random.Random] = None) -> Tuple[Outcome, int]:
+        mod = self._mod
         if verboseAttributeChecks:
-            print(f'{self.label} modifier: {self.modifier()}')
+            print(f'{self.label} modifier: {mod}')
 
-        return extendedCheck(threshold - self.modifier(), maxRolls)
+        return extendedCheck(threshold - mod, maxRolls, rng)
 
     def __str__(self):
         return f'{self.label}: {self.score}'
@@ -53,6 +73,8 @@ class Strength(Attribute):
     Note that the a characters endurance is not determined by the strength attribute.
     """
 
+    __slots__ = ()
+
     def __init__(self, score):
         super(Strength, self).__init__(score, 'Str')
 
@@ -63,6 +85,8 @@ class Dexterity(Attribute):
     This is your main firearms attribute, but is also used for actions where a character has to carefully control their body.
     """
 
+    __slots__ = ()
+
     def __init__(self, score):
         super(Dexterity, self).__init__(score, 'Dex')
 
@@ -73,6 +97,8 @@ class Constitution(Attribute):
     A higher constitution improves the survivability of the character.
     """
 
+    __slots__ = ()
+
     def __init__(self, score):
         super(Constitution, self).__init__(score, 'Con')
 
@@ -82,6 +108,8 @@ class Intelligence(Attribute):
     Intelligence is the main hacking attribute and used for all actions that require direct interaction with technology.
     """
 
+    __slots__ = ()
+
     def __init__(self, score):
         super(Intelligence, self).__init__(score, 'Int')
 
@@ -91,6 +119,8 @@ class Wisdom(Attribute):
     The wisdom attribute is the main defense attribute and corresponds to a characters situational awareness.
     """
 
+    __slots__ = ()
+
     def __init__(self, score):
         super(Wisdom, self).__init__(score, 'Wis')
 
@@ -100,6 +130,8 @@ class Charisma(Attribute):
     Note only does charisma determine how attractive your character is, it is also the attribute used for social related actions.
     """
 
+    __slots__ = ()
+
     def __init__(self, score):
         super(Charisma, self).__init__(score, 'Cha')
 
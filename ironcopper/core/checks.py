@@ -12,13 +12,65 @@ There are only 3 basic types of rolls that are used for all mechanics of the gam
 
 """
 
+import hashlib
+import math
 import random
 
-from enum import Enum
+from array import array
+from bisect import bisect_left
+from enum import Enum, IntEnum
+from functools import lru_cache
+from itertools import accumulate
 from typing import Optional, Tuple
 
+__all__ = [
+    'd20', 'd6', 'Outcome', 'check', 'extendedCheck', 'd20Many', 'checkMany',
+    'setSeed', 'setVerbose', 'makeRng', 'useFastRng', 'verboseChecks',
+]
 
-def d20(adv: int = 0) -> int:
+_randint = random.randint
+_getrandbits = random.getrandbits
+
+_D20_FACES = range(1, 21)
+
+_LCG_MASK = (1 << 64) - 1
+_lcgState = [0]
+_npSeed = 0
+_npRng = None
+
+
+def _lcg() -> int:
+    state = (_lcgState[0] * 6364136223846793005 + 1442695040888963407) & _LCG_MASK
+    _lcgState[0] = state
+    return state
+
+
+def _fastD20() -> int:
+    return (_lcg() >> 33) % 20 + 1
+
+
+def _fastD6() -> int:
+    return (_lcg() >> 33) % 6 + 1
+
+
+_kernels = None
+
+
+def _loadKernels():
+    # Numba kernels are imported (and compiled) on first use to keep importing this module cheap.
+    # `_kernels` ends up as the `_jit` module, or False if Numba is not installed.
+    global _kernels
+
+    try:
+        from . import _jit as kernels
+    except ImportError:
+        kernels = False
+
+    _kernels = kernels
+    return kernels
+
+
+def d20(adv: int = 0, rng: Optional[random.Random] = None, _randint=_randint, _fastD20=_fastD20, _max=max, _min=min) -> int:
     """
     Rolls a 20-sided die (D20) and returns the result — the higher, the better.
     This is commonly used for checks and extended checks.
@@ -41,34 +93,67 @@ def d20(adv: int = 0) -> int:
     > d20(2)            # roll with double advantage
     D20+: [9, 4, 16] → 16
     ```
+
+    Passing a dedicated `rng` (see `makeRng`) draws the dice from it instead of the module's RNG.
     """
 
-    rolls = [random.randint(1, 20) for _ in range(abs(adv) + 1)]
+    if adv == 0:
+        if rng is not None:
+            result = rng.randint(1, 20)
+        elif useFastRng:
+            result = _fastD20()
+        else:
+            result = _randint(1, 20)
 
-    if adv > 0:
-        result = max(rolls)
-    else:
-        result = min(rolls)
+        if verboseChecks:
+            print(f'{_D20_LABELS[0]}: {result}')
+
+        return result
+
+    rolls = _d20rolls(abs(adv) + 1, rng)
+    result = _max(rolls) if adv > 0 else _min(rolls)
 
     if verboseChecks:
-        if adv != 0:
-            print(f'{_d20label(adv)}: {rolls} → {result}')
-        else:
-            print(f'{_d20label(adv)}: {result}')
+        print(f'{_D20_LABELS[(adv > 0) - (adv < 0)]}: {rolls} → {result}')
 
     return result
 
 
-def _d20label(adv: int = 0) -> str:
-    label = 'D20'
-    if adv > 0:
-        label += '+'
-    elif adv < 0:
-        label += '-'
-    return label
+def _d20quiet(adv: int = 0, rng: Optional[random.Random] = None, _randint=_randint, _fastD20=_fastD20, _max=max, _min=min) -> int:
+    if adv == 0:
+        if rng is not None:
+            return rng.randint(1, 20)
+        if useFastRng:
+            return _fastD20()
+        return _randint(1, 20)
+
+    if rng is None and useFastRng:
+        kernels = _kernels if _kernels is not None else _loadKernels()
+        if kernels:
+            result, state = kernels.d20Kernel(adv, _lcgState[0])
+            _lcgState[0] = int(state)
+            return int(result)
+
+    rolls = _d20rolls(abs(adv) + 1, rng)
+    return _max(rolls) if adv > 0 else _min(rolls)
+
+
+_d20quiet.__doc__ = d20.__doc__
+_d20verbose = d20
+
+
+def _d20rolls(count: int, rng: Optional[random.Random] = None, _fastD20=_fastD20, _choices=random.choices) -> list:
+    if rng is not None:
+        return rng.choices(_D20_FACES, k=count)
+    if useFastRng:
+        return [_fastD20() for _ in range(count)]
+    return _choices(_D20_FACES, k=count)
+
+
+_D20_LABELS = {-1: 'D20-', 0: 'D20', 1: 'D20+'}
 
 
-def d6(count: int = 1, critical: bool = False) -> int:
+def d6(count: int = 1, critical: bool = False, rng: Optional[random.Random] = None, _randint=_randint, _fastD6=_fastD6, _sum=sum) -> int:
     """
     Rolls 6-sided dice (D6), commonly used for damage rolls.
     The result is simply the sum of all dice.
@@ -84,23 +169,85 @@ def d6(count: int = 1, critical: bool = False) -> int:
     > d6(3, critical=True)
     3D6+: [1, 3, 1] → 23
     ```
+
+    Like `d20`, an optional `rng` can be passed to draw the dice from.
     """
 
-    rolls = [random.randint(1, 6) for _ in range(count)]
-    result = sum(rolls)
+    if count == 1:
+        if rng is not None:
+            result = rng.randint(1, 6)
+        elif useFastRng:
+            result = _fastD6()
+        else:
+            result = _randint(1, 6)
+    else:
+        rolls = _d6rolls(count, rng)
+        result = _sum(rolls)
 
     if critical:
         result += count * 6
 
     if verboseChecks:
         if count > 1:
-            print(f'{_d6label(count=count, critical=critical)}: {rolls} → {result}')
+            print(f'{_d6label(count=count, critical=critical)}: {rolls.tolist()} → {result}')
         else:
             print(f'{_d6label(count=count, critical=critical)}: {result}')
 
     return result
 
 
+def _d6quiet(count: int = 1, critical: bool = False, rng: Optional[random.Random] = None, _randint=_randint, _fastD6=_fastD6, _sum=sum) -> int:
+    kernels = None
+    if rng is None and useFastRng:
+        kernels = _kernels if _kernels is not None else _loadKernels()
+
+    if kernels:
+        result, state = kernels.d6Kernel(count, _lcgState[0])
+        _lcgState[0] = int(state)
+    elif count == 1:
+        if rng is not None:
+            result = rng.randint(1, 6)
+        elif useFastRng:
+            result = _fastD6()
+        else:
+            result = _randint(1, 6)
+    else:
+        result = _sum(_d6rolls(count, rng))
+
+    if critical:
+        result += count * 6
+
+    return int(result)
+
+
+_d6quiet.__doc__ = d6.__doc__
+_d6verbose = d6
+
+
+def _d6rolls(count: int, rng: Optional[random.Random] = None, _fastD6=_fastD6, _getrandbits=_getrandbits) -> array:
+    if rng is not None:
+        _getrandbits = rng.getrandbits
+    elif useFastRng:
+        rolls = array('b')
+        append = rolls.append
+        for _ in range(count):
+            append(_fastD6())
+        return rolls
+
+    # Draws 3 random bits per die in one go, rejecting the lanes that do not map to a face (0 and 7).
+    rolls = array('b')
+    while len(rolls) < count:
+        needed = count - len(rolls)
+        bits = _getrandbits(3 * needed)
+        for _ in range(needed):
+            face = bits & 7
+            bits >>= 3
+            if 1 <= face <= 6:
+                rolls.append(face)
+    return rolls
+
+
+@lru_cache(maxsize=64)
 def _d6label(count: int = 1, critical: bool = False) -> str:
     label = f'{count}D6'
     if critical:
@@ -108,12 +255,16 @@ def _d6label(count: int = 1, critical: bool = False) -> str:
     return label
 
 
-class Outcome(Enum):
+class Outcome(IntEnum):
     """
     Checks can result in various outcomes.
     These are explained here.
+
+    Outcomes are ordered integers, thus `outcome >= Outcome.NearFail` tells whether the task succeeded.
     """
 
+    __str__ = Enum.__str__
+
     CriticalFail = -2
     """
     A critical fail occurs when the roll results in a 1.
@@ -146,26 +297,41 @@ class Outcome(Enum):
     """
 
 
-def check(threshold: int, adv: int = 0) -> Outcome:
-    """
-    A check rolls a D20 (optionally with advantage / disadvantage) against a given threshold.
-    """
+_COMPARISON_OUTCOMES = (Outcome.Fail, Outcome.NearFail, Outcome.Success)
 
-    roll = d20(adv=adv)
 
+def _outcome(roll: int, threshold: int) -> Outcome:
     if roll == 1:
         return Outcome.CriticalFail
-    elif roll == 20:
+    if roll == 20:
         return Outcome.CriticalSuccess
-    elif roll < threshold:
-        return Outcome.Fail
-    elif roll > threshold:
-        return Outcome.Success
-    else:
-        return Outcome.NearFail
+    return _COMPARISON_OUTCOMES[(roll > threshold) - (roll < threshold) + 1]
+
+
+# Indexed by [roll - 1][threshold + 20]. Thresholds outside of -20..20 behave like the nearest bound.
+# Only covers integer thresholds, others go through `_outcome`.
+_CHECK_LUT = tuple(tuple(_outcome(roll, threshold) for threshold in range(-20, 21)) for roll in range(1, 21))
+
+
+def check(threshold: int, adv: int = 0, rng: Optional[random.Random] = None) -> Outcome:
+    """
+    A check rolls a D20 (optionally with advantage / disadvantage) against a given threshold.
+    """
+
+    roll = d20(adv=adv, rng=rng)
+
+    if not isinstance(threshold, int):
+        return _outcome(roll, threshold)
+
+    if threshold > 20:
+        threshold = 20
+    elif threshold < -20:
+        threshold = -20
+    return _CHECK_LUT[roll - 1][threshold + 20]
 
 
-def extendedCheck(threshold: int, maxRolls: Optional[int] = None) -> Tuple[Outcome, int]:
+def extendedCheck(threshold: int, maxRolls: Optional[int] = None, rng: Optional[random.Random] = None,
+                  _Fail=Outcome.Fail, _Success=Outcome.Success, _min=min, _d20rolls=_d20rolls, _fastD20=_fastD20) -> Tuple[Outcome, int]:
     """
     An extended check accumulates D20 rolls until, either, a given threshold is reached, or a maximum number of rolls is exhausted.
     Each roll corresponds to a fixed in-game time period spent working on the task.
@@ -183,25 +349,200 @@ def extendedCheck(threshold: int, maxRolls: Optional[int] = None) -> Tuple[Outco
     > extendedCheck(30, 2)
     (<Outcome.Fail: -1>, 2)         # Fail due to exhausting the time limit
     ```
+
+    With `useFastRng` enabled, dice are drawn one at a time.
+    Otherwise, i.e. when drawing from the `random` module or a given `rng`, dice are drawn in batches and the ones left over once the threshold is reached are discarded.
+    The generator therefore advances by more draws than the number of rolls reported, which is still reproducible for a given seed, but differs from earlier versions.
     """
 
     accumulator = 0
     rollCount = 0
+
+    if rng is None and useFastRng:
+        if not verboseChecks:
+            kernels = _kernels if _kernels is not None else _loadKernels()
+            if kernels:
+                # The accumulator is an integer, so reaching ceil(threshold) is the same as reaching threshold.
+                success, rollCount, state = kernels.extendedCheckKernel(math.ceil(threshold), maxRolls or 0, _lcgState[0])
+                _lcgState[0] = int(state)
+                return (_Success if success else _Fail), int(rollCount)
+
+        # Rolls one die at a time, consuming the LCG exactly like the kernel does.
+        while accumulator < threshold:
+            if maxRolls and rollCount >= maxRolls:
+                return _Fail, maxRolls
+
+            roll = _fastD20()
+            if verboseChecks:
+                print(f'{_D20_LABELS[0]}: {roll}')
+
+            accumulator += roll
+            rollCount += 1
+
+        return _Success, rollCount
+
+    # Starts with the expected number of rolls (10.5 per roll) and doubles the batch until the threshold is met.
+    batchSize = max(1, math.ceil(threshold * 2 / 21))
     while accumulator < threshold:
-        if maxRolls and rollCount >= maxRolls:
-            return Outcome.Fail, maxRolls
+        if maxRolls:
+            if rollCount >= maxRolls:
+                return _Fail, maxRolls
+            batchSize = _min(batchSize, maxRolls - rollCount)
+
+        rolls = _d20rolls(batchSize, rng)
+        totals = list(accumulate(rolls, initial=accumulator))
+        used = _min(bisect_left(totals, threshold), batchSize)
+
+        if verboseChecks:
+            for roll in rolls[:used]:
+                print(f'{_D20_LABELS[0]}: {roll}')
+
+        accumulator = totals[used]
+        rollCount += used
+        batchSize *= 2
+
+    return _Success, rollCount
+
+
+def d20Many(n: int, adv: int = 0) -> 'np.ndarray':
+    """
+    Rolls `n` independent D20s, like `d20`, and returns the results as NumPy array.
+    This is intended for simulations and balancing (e.g. estimating the probability of passing a check), hence the rolls are never shown.
+
+    Requires [NumPy](https://numpy.org/).
+
+    Example:
+    ```
+    > d20Many(5, adv=1)
+    array([17, 12, 20,  9, 14], dtype=int8)
+    ```
+    """
+
+    np = _numpy()
+    draws = _npRng.integers(1, 21, size=(n, abs(adv) + 1), dtype=np.int8)
+    if adv > 0:
+        return draws.max(axis=1)
+    if adv < 0:
+        return draws.min(axis=1)
+    return draws[:, 0]
+
+
+def checkMany(threshold: int, n: int, adv: int = 0) -> 'np.ndarray':
+    """
+    Performs `n` independent checks, like `check`, and returns the outcome values (see `Outcome`) as NumPy array.
+
+    Requires [NumPy](https://numpy.org/).
+
+    Example:
+    ```
+    > (checkMany(12, 100000) >= Outcome.NearFail).mean()      # probability of success
+    0.44986
+    ```
+    """
+
+    rolls = d20Many(n, adv)
+
+    if not isinstance(threshold, int):
+        np = _numpy()
+        codes = np.sign(rolls - threshold).astype(np.int8)
+        codes[rolls == 1] = Outcome.CriticalFail
+        codes[rolls == 20] = Outcome.CriticalSuccess
+        return codes
 
-        accumulator += d20()
-        rollCount += 1
+    threshold = min(max(threshold, -20), 20)
+    return _checkCodes()[rolls - 1, threshold + 20]
 
-    return Outcome.Success, rollCount
 
+def _numpy():
+    # NumPy is only needed for simulations, hence it is imported on first use.
+    global _npRng
 
-setSeed = random.seed
+    try:
+        import numpy as np
+    except ImportError:
+        raise ImportError('d20Many and checkMany require NumPy') from None
+
+    if _npRng is None:
+        _npRng = np.random.default_rng(_npSeed)
+    return np
+
+
+@lru_cache(maxsize=None)
+def _checkCodes():
+    np = _numpy()
+    return np.array([[int(outcome) for outcome in row] for row in _CHECK_LUT], dtype=np.int8)
+
+
+def setSeed(a=None):
+    """
+    Allows one to set a specific seed for the random number generator (RNG).
+    This allows rolls to be reproducible.
+    """
+
+    random.seed(a)
+    _seedGenerators(a)
+
+
+def _seedGenerators(a=None):
+    # Uses a separate generator, such that seeding does not advance the stream of the random module.
+    global _npSeed, _npRng
+
+    seeder = random.Random(a)
+    _lcgState[0] = seeder.getrandbits(64)
+    _npSeed = seeder.getrandbits(64)
+    _npRng = None
+
+
+def setVerbose(flag: bool):
+    """
+    Enables or disables `verboseChecks`.
+
+    Disabling it additionally swaps `d20` and `d6` of this module for variants that skip the option entirely, saving a check on every roll.
+    Consequently, after `setVerbose(False)`, `d20`, `d6` and `check` ignore `verboseChecks` and stay silent until `setVerbose(True)` is called, even if `verboseChecks` is set to `True` directly.
+    References obtained while disabled (e.g. `from ironcopper.core.checks import d20`) keep the quiet variant, other references keep honouring `verboseChecks`.
+    """
+
+    global verboseChecks, d20, d6
+    verboseChecks = flag
+    d20 = _d20verbose if flag else _d20quiet
+    d6 = _d6verbose if flag else _d6quiet
+
+
+def makeRng(context: str) -> random.Random:
+    """
+    Creates a dedicated random number generator (RNG) seeded from the given context, like an encounter name or a player.
+    The same context always yields the same sequence of rolls, independent of `setSeed` and of other contexts.
+
+    Example:
+    ```
+    > rng = makeRng('ambush at the docks')
+    > check(12, rng=rng)
+    D20: 11
+    <Outcome.Fail: -1>
+    ```
+    """
+
+    digest = hashlib.blake2b(context.encode(), digest_size=8).digest()
+    return random.Random(int.from_bytes(digest, 'big'))
+
+
+useFastRng = True
 """
-Allows one to set a specific seed for the random number generator (RNG).
-This allows rolls to be reproducible.
+Enabling this option makes dice rolls use a small, fast linear congruential generator instead of Python's Mersenne Twister.
+Disable it to draw dice from the `random` module instead, for instance to share its state with other code.
+
+If [Numba](https://numba.pydata.org/) is installed, rolls with this option enabled and `verboseChecks` disabled run as compiled kernels.
+The kernels are compiled on first use and produce the same rolls as the pure-Python code.
 """
 
 verboseChecks = True
-"""Enabling this option shows the result of dice rolls."""
+"""
+Enabling this option shows the result of dice rolls.
+
+Setting it directly works as long as `setVerbose(False)` has not been called.
+Once it has, `d20`, `d6` and `check` no longer read this option and re-enabling output requires `setVerbose(True)`.
+Prefer `setVerbose` for changing it, which also removes the cost of checking the option from `d20` and `d6`.
+"""
+
+_seedGenerators()
+setVerbose(verboseChecks)
@@ -0,0 +1,227 @@
+import math
+
+import pytest
+
+from ironcopper.core import checks
+
+
+@pytest.fixture(autouse=True)
+def restoreOptions():
+    yield
+    checks.useFastRng = True
+    checks.setVerbose(True)
+
+
+def _rollSequence(seed):
+    checks.setSeed(seed)
+    return [
+        checks.d20(),
+        checks.d20(2),
+        checks.d20(-3),
+        checks.d6(),
+        checks.d6(4, critical=True),
+        checks.extendedCheck(30),
+        checks.extendedCheck(60, 3),
+        checks.extendedCheck(10.5, 3),
+        checks.extendedCheck(30.5),
+        checks.d20(),
+        checks.d6(2),
+    ]
+
+
+@pytest.mark.parametrize('seed', range(20))
+def test_fast_rng_rolls_do_not_depend_on_verbosity(capsys, seed):
+    # Quiet rolls run as Numba kernels if available, verbose rolls always use the pure-Python LCG.
+    checks.setVerbose(True)
+    verbose = _rollSequence(seed)
+
+    checks.setVerbose(False)
+    quiet = _rollSequence(seed)
+
+    assert quiet == verbose
+
+
+def test_kernels_match_python_lcg():
+    pytest.importorskip('numba')
+    kernels = checks._loadKernels()
+
+    for seed in range(50):
+        checks.setSeed(seed)
+        expected = [max(checks._fastD20() for _ in range(3)), sum(checks._fastD6() for _ in range(5))]
+        expectedState = checks._lcgState[0]
+
+        checks.setSeed(seed)
+        best, state = kernels.d20Kernel(2, checks._lcgState[0])
+        total, state = kernels.d6Kernel(5, state)
+
+        assert [best, total] == expected
+        assert int(state) == expectedState
+
+
+def test_verbose_checks_option_is_honoured(capsys):
+    checks.verboseChecks = False
+    checks.d20()
+    checks.d20(1)
+    checks.d6(2)
+    assert capsys.readouterr().out == ''
+
+    checks.verboseChecks = True
+    checks.d20()
+    assert capsys.readouterr().out.startswith('D20: ')
+
+
+def test_verbose_checks_option_is_ignored_after_set_verbose_false(capsys):
+    checks.setVerbose(False)
+    checks.verboseChecks = True
+    checks.d20()
+    checks.d6(2)
+    checks.check(10)
+    assert capsys.readouterr().out == ''
+
+    checks.extendedCheck(10, 1)
+    assert capsys.readouterr().out.startswith('D20: ')
+
+    checks.setVerbose(True)
+    checks.d20()
+    checks.d6(2)
+    assert capsys.readouterr().out.splitlines()[1].startswith('2D6: ')
+
+
+@pytest.mark.parametrize('threshold', [-25, 1, 10, 10.5, 12.0, 25])
+def test_check_matches_outcome_rules(monkeypatch, threshold):
+    for roll in range(1, 21):
+        monkeypatch.setattr(checks, 'd20', lambda adv=0, rng=None: roll)
+        assert checks.check(threshold) is checks._outcome(roll, threshold)
+
+
+class _ScriptedRng:
+    """Hands out the given D20 faces in order, regardless of how many are requested at once."""
+
+    def __init__(self, faces):
+        self.faces = iter(faces)
+        self.drawn = 0
+
+    def choices(self, population, k):
+        self.drawn += k
+        return [next(self.faces) for _ in range(k)]
+
+
+@pytest.mark.parametrize('threshold, maxRolls, expected', [
+    (30, None, (checks.Outcome.Success, 6)),
+    (30.5, None, (checks.Outcome.Success, 7)),
+    (30.5, 6, (checks.Outcome.Fail, 6)),
+    (30.5, 7, (checks.Outcome.Success, 7)),
+    (0, None, (checks.Outcome.Success, 0)),
+    (500, None, (checks.Outcome.Success, 100)),
+])
+def test_batched_extended_check_counts_rolls(capsys, threshold, maxRolls, expected):
+    rng = _ScriptedRng([5] * 1000)
+
+    assert checks.extendedCheck(threshold, maxRolls, rng=rng) == expected
+    assert rng.drawn >= expected[1]
+    assert capsys.readouterr().out.splitlines() == ['D20: 5'] * expected[1]
+
+
+@pytest.mark.parametrize('threshold', [30, 30.5, 200])
+def test_batched_extended_check_without_fast_rng(threshold):
+    checks.useFastRng = False
+    checks.setVerbose(False)
+
+    checks.setSeed(7)
+    first = [checks.extendedCheck(threshold), checks.extendedCheck(threshold, 2)]
+    checks.setSeed(7)
+    second = [checks.extendedCheck(threshold), checks.extendedCheck(threshold, 2)]
+
+    assert first == second
+    outcome, rollCount = first[0]
+    assert outcome == checks.Outcome.Success
+    assert math.ceil(threshold / 20) <= rollCount <= math.ceil(threshold)
+    assert first[1][1] <= 2
+
+
+def test_d20_many_is_reproducible():
+    pytest.importorskip('numpy')
+
+    checks.setSeed(7)
+    first = [checks.d20Many(100), checks.d20Many(100, adv=2)]
+    checks.setSeed(7)
+    second = [checks.d20Many(100), checks.d20Many(100, adv=2)]
+
+    assert all((a == b).all() for a, b in zip(first, second))
+    assert first[0].min() >= 1 and first[0].max() <= 20
+
+
+@pytest.mark.parametrize('adv', [-2, -1, 0, 1, 3])
+def test_d20_many_reduces_advantage(monkeypatch, adv):
+    np = pytest.importorskip('numpy')
+
+    monkeypatch.setattr(checks, '_npRng', np.random.default_rng(3))
+    rolls = checks.d20Many(1000, adv)
+
+    draws = np.random.default_rng(3).integers(1, 21, size=(1000, abs(adv) + 1), dtype=np.int8)
+    expected = draws.max(axis=1) if adv > 0 else draws.min(axis=1)
+    assert (rolls == expected).all()
+
+
+@pytest.mark.parametrize('threshold', [-25, -20, 1, 10, 12, 20, 25, 0.5, 10.5, 12.0, 25.5])
+def test_check_many_matches_check(monkeypatch, threshold):
+    np = pytest.importorskip('numpy')
+
+    rolls = np.arange(1, 21, dtype=np.int8)
+    monkeypatch.setattr(checks, 'd20Many', lambda n, adv=0: rolls)
+    outcomes = checks.checkMany(threshold, len(rolls))
+
+    assert outcomes.tolist() == [checks._outcome(int(roll), threshold) for roll in rolls]
+    for roll in rolls:
+        monkeypatch.setattr(checks, 'd20', lambda adv=0, rng=None: int(roll))
+        assert checks.check(threshold) == outcomes[roll - 1]
+
+
+def _contextRolls(context):
+    rng = checks.makeRng(context)
+    return [
+        checks.d20(rng=rng),
+        checks.d20(-2, rng=rng),
+        checks.d6(rng=rng),
+        checks.d6(3, critical=True, rng=rng),
+        checks.check(10, rng=rng),
+        checks.check(10.5, adv=1, rng=rng),
+        checks.extendedCheck(30, rng=rng),
+        checks.extendedCheck(60, 2, rng=rng),
+    ] + [checks.d20(rng=rng) for _ in range(20)]
+
+
+def test_make_rng_replays_context():
+    assert _contextRolls('ambush at the docks') == _contextRolls('ambush at the docks')
+    assert _contextRolls('ambush at the docks') != _contextRolls('chase through the market')
+
+
+@pytest.mark.parametrize('verbose', [True, False])
+def test_make_rng_is_independent_of_module_rng(capsys, verbose):
+    checks.setVerbose(verbose)
+    checks.setSeed(1)
+    expected = _contextRolls('ambush at the docks')
+
+    checks.setSeed(2)
+    checks.useFastRng = False
+    assert _contextRolls('ambush at the docks') == expected
+
+
+@pytest.mark.parametrize('useFastRng', [True, False])
+def test_rng_does_not_consume_module_rng(capsys, useFastRng):
+    checks.useFastRng = useFastRng
+
+    checks.setSeed(3)
+    expected = [checks.d20(), checks.d6(2)]
+
+    checks.setSeed(3)
+    _contextRolls('ambush at the docks')
+    assert [checks.d20(), checks.d6(2)] == expected
+
+
+def test_attribute_checks_use_rng(capsys):
+    from ironcopper import Dexterity
+
+    dexterity = Dexterity(14)
+    assert dexterity.check(12, rng=checks.makeRng('lockpick')) == checks.check(12 - 4, rng=checks.makeRng('lockpick'))
+    assert dexterity.extendedCheck(40, 3, rng=checks.makeRng('lockpick')) == checks.extendedCheck(40 - 4, 3, rng=checks.makeRng('lockpick'))